@@ -1,17 +1,21 @@
 from flask import Flask, jsonify, send_from_directory
 from flask_cors import CORS
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import DBAPIError
 from .models import db, DraftArticle
 from .routes.dashboard import dashboard_bp
 from .routes.approve import approve_bp
+from .routes.translate import translate_bp
 from .config import Config
 import logging
 import os
+import threading
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def create_app():
+def create_app(create_tables=True):
     # Serve static assets from the frontend's build folder
     app = Flask(__name__, static_folder='../frontend/dist/assets', static_url_path='/assets')
     app.config.from_object(Config)
@@ -25,6 +29,7 @@ def create_app():
     # Register blueprints
     app.register_blueprint(dashboard_bp, url_prefix='/api')
     app.register_blueprint(approve_bp, url_prefix='/api')
+    app.register_blueprint(translate_bp, url_prefix='/api')
     
     # Serve the React App from the dist folder
     @app.route('/', defaults={'path': ''})
@@ -54,18 +59,85 @@ def create_app():
         db.session.rollback()
         return jsonify({'error': 'Internal server error'}), 500
     
-    # Create tables
-    with app.app_context():
-        # Ensure data directory exists
-        os.makedirs('data', exist_ok=True)
+    # Create tables (skipped when the caller sets the schema up itself)
+    if create_tables and app.config.get('LAZY_CREATE_TABLES'):
+        # Set up the schema in the background so worker boot does not block
+        # on it; requests only wait if they arrive before it has finished
+        tables_ready = threading.Event()
+        tables_lock = threading.Lock()
         
-        # Create database tables
-        db.create_all()
+        def create_tables_once():
+            with tables_lock:
+                if tables_ready.is_set():
+                    return
+                with app.app_context():
+                    _create_tables()
+                tables_ready.set()
         
-        logger.info("Database tables created successfully")
+        def create_tables_in_background():
+            try:
+                create_tables_once()
+            except Exception as e:
+                logger.error(f"Error creating database tables: {str(e)}")
+        
+        threading.Thread(target=create_tables_in_background, daemon=True).start()
+        
+        @app.before_request
+        def ensure_tables():
+            if not tables_ready.is_set():
+                # Waits for the background thread, or retries if it failed
+                create_tables_once()
+    elif create_tables:
+        with app.app_context():
+            _create_tables()
     
     return app
 
+def _create_tables():
+    # Ensure data directory exists
+    os.makedirs('data', exist_ok=True)
+    
+    # Create database tables
+    db.create_all()
+    _add_missing_columns()
+    
+    logger.info("Database tables created successfully")
+
+# Nullable columns added after draft_articles first shipped; create_all
+# does not alter existing tables, so these are added on startup
+ADDED_COLUMNS = [
+    DraftArticle.__table__.c.summary,
+    DraftArticle.__table__.c.key_points,
+]
+
+def _add_missing_columns():
+    """Add any of ADDED_COLUMNS that an existing database is missing"""
+    dialect = db.engine.dialect
+    preparer = dialect.identifier_preparer
+    
+    for column in ADDED_COLUMNS:
+        table_name = column.table.name
+        if _has_column(table_name, column.name):
+            continue
+        
+        statement = 'ALTER TABLE {} ADD COLUMN {} {}'.format(
+            preparer.quote(table_name),
+            preparer.quote(column.name),
+            column.type.compile(dialect=dialect)
+        )
+        try:
+            with db.engine.begin() as connection:
+                connection.execute(text(statement))
+            logger.info(f"Added column {table_name}.{column.name}")
+        except DBAPIError:
+            # Another worker may have added the column in the meantime
+            if not _has_column(table_name, column.name):
+                raise
+
+def _has_column(table_name, column_name):
+    columns = inspect(db.engine).get_columns(table_name)
+    return any(column['name'] == column_name for column in columns)
+
 if __name__ == '__main__':
     app = create_app()
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -1,10 +1,20 @@
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
+def _env_limit(name, default):
+    """Read an integer limit from the environment; empty or 'none' disables it"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    if value.strip().lower() in ('', 'none'):
+        return None
+    return int(value)
 
 BASE_DIR = os.path.abspath(os.path.dirname(__file__))
 
+# An explicit path skips python-dotenv's call-stack search for the file
+load_dotenv(os.path.join(BASE_DIR, '.env'))
+
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
     
@@ -17,6 +27,9 @@ class Config:
         SQLALCHEMY_DATABASE_URI = db_url or f"sqlite:///{os.path.join(BASE_DIR, 'data', 'drafts.db')}"
     
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    # Opt-in: create tables in a background thread instead of blocking
+    # worker boot; database access outside requests must wait for it
+    LAZY_CREATE_TABLES = os.environ.get('LAZY_CREATE_TABLES', 'false').lower() == 'true'
     GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
     
     # RSS Feed URLs
@@ -28,6 +41,14 @@ class Config:
         'https://www.theguardian.com/world/rss'
     ]
     
+    # Fetch Settings (None disables a limit)
+    FETCH_SETTINGS = {
+        'global_limit': _env_limit('FETCH_GLOBAL_LIMIT', 100),
+        'per_feed_limit': _env_limit('FETCH_PER_FEED_LIMIT', 20),
+        'batch_size': int(os.environ.get('FETCH_BATCH_SIZE', 50)),
+        'max_batch_size': 500
+    }
+    
     # AI Settings
     AI_REWRITE_SETTINGS = {
         'max_tokens': 1000,
@@ -35,3 +56,10 @@ class Config:
         'default_tone': 'professional',
         'default_length': 'medium'
     }
+    
+    # Translation Settings
+    TRANSLATION_SETTINGS = {
+        'languages': ['es', 'fr', 'de', 'ar', 'ur', 'zh'],
+        'max_workers': 6,
+        'default_mode': 'concurrent'  # concurrent, combined
+    }
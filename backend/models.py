@@ -1,5 +1,6 @@
 from flask_sqlalchemy import SQLAlchemy
 from datetime import datetime
+import hashlib
 
 db = SQLAlchemy()
 
@@ -10,6 +11,8 @@ class DraftArticle(db.Model):
     title = db.Column(db.String(500), nullable=False)
     original_text = db.Column(db.Text, nullable=False)
     ai_text = db.Column(db.Text, nullable=True)
+    summary = db.Column(db.Text, nullable=True)
+    key_points = db.Column(db.JSON, nullable=True)
     source = db.Column(db.String(200), nullable=False)
     category = db.Column(db.String(100), nullable=True)
     url = db.Column(db.String(1000), nullable=True)
@@ -17,12 +20,27 @@ class DraftArticle(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    translations = db.relationship('ArticleTranslation', backref='article', lazy=True,
+                                   cascade='all, delete-orphan')
+    
+    @property
+    def translation_source(self):
+        """Text that translations of this article are made from"""
+        return self.ai_text or self.original_text
+    
+    def current_translations(self):
+        """Stored translations made from the article's current text"""
+        source_hash = ArticleTranslation.hash_source(self.translation_source)
+        return [t for t in self.translations if t.source_hash == source_hash]
+    
     def to_dict(self):
         return {
             'id': self.id,
             'title': self.title,
             'original_text': self.original_text,
             'ai_text': self.ai_text,
+            'summary': self.summary,
+            'key_points': self.key_points,
             'source': self.source,
             'category': self.category,
             'url': self.url,
@@ -32,4 +50,33 @@ class DraftArticle(db.Model):
         }
     
     def __repr__(self):
-        return f'<DraftArticle {self.id}: {self.title[:50]}...>'
\ No newline at end of file
+        return f'<DraftArticle {self.id}: {self.title[:50]}...>'
+
+class ArticleTranslation(db.Model):
+    __tablename__ = 'article_translations'
+    __table_args__ = (db.UniqueConstraint('article_id', 'language', name='uq_article_language'),)
+    
+    id = db.Column(db.Integer, primary_key=True)
+    article_id = db.Column(db.Integer, db.ForeignKey('draft_articles.id'), nullable=False, index=True)
+    language = db.Column(db.String(20), nullable=False)
+    text = db.Column(db.Text, nullable=False)
+    source_hash = db.Column(db.String(64), nullable=False)  # sha256 of the text that was translated
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    @staticmethod
+    def hash_source(text):
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'article_id': self.article_id,
+            'language': self.language,
+            'text': self.text,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+        }
+    
+    def __repr__(self):
+        return f'<ArticleTranslation {self.article_id}: {self.language}>'
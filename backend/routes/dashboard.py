@@ -1,7 +1,7 @@
 from flask import Blueprint, jsonify, request
 from ..models import db, DraftArticle
 from ..services.fetcher import FetcherService
-from ..services.ai_service import AIService
+from ..services.ai_service import get_ai_service
 from ..config import Config
 import logging
 
@@ -33,34 +33,36 @@ def get_article(article_id):
 def fetch_articles():
     """Fetch new articles from RSS feeds"""
     try:
+        data = request.get_json(silent=True) or {}
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Request body must be a JSON object'}), 400
+        
+        settings = Config.FETCH_SETTINGS
+        try:
+            limit = _parse_limit(data.get('limit', settings['global_limit']))
+            per_feed_limit = _parse_limit(data.get('per_feed_limit', settings['per_feed_limit']))
+            batch_size = _parse_limit(data.get('batch_size', settings['batch_size']), allow_none=False)
+            # Bounded so the per-batch duplicate check stays a small IN (...) query
+            batch_size = min(max(1, batch_size), settings['max_batch_size'])
+        except (TypeError, ValueError, OverflowError):
+            return jsonify({'error': 'limit, per_feed_limit and batch_size must be non-negative integers'}), 400
+        
         fetcher = FetcherService(Config.RSS_FEEDS)
-        articles = fetcher.fetch_articles(limit=10)
+        articles = fetcher.iter_articles(limit=limit, per_feed_limit=per_feed_limit)
         
+        total_fetched = 0
         saved_count = 0
-        for article_data in articles:
-            # Check if article already exists (by title and source)
-            existing = DraftArticle.query.filter_by(
-                title=article_data['title'],
-                source=article_data['source']
-            ).first()
-            
-            if not existing:
-                draft = DraftArticle(
-                    title=article_data['title'],
-                    original_text=article_data['original_text'],
-                    source=article_data['source'],
-                    category=article_data.get('category'),
-                    url=article_data.get('url'),
-                    status='pending'
-                )
-                db.session.add(draft)
-                saved_count += 1
+        seen = set()
         
-        db.session.commit()
+        # Entries are pulled from the feeds only as each batch is persisted
+        for batch in FetcherService.batched(articles, batch_size):
+            total_fetched += len(batch)
+            saved_count += _save_new_articles(batch, seen)
+            db.session.commit()
         
         return jsonify({
             'message': f'Successfully fetched {saved_count} new articles',
-            'total_fetched': len(articles),
+            'total_fetched': total_fetched,
             'saved_count': saved_count
         })
         
@@ -69,6 +71,48 @@ def fetch_articles():
         db.session.rollback()
         return jsonify({'error': 'Failed to fetch articles'}), 500
 
+def _parse_limit(value, allow_none=True):
+    """Convert a request limit to a non-negative int (or None for no limit)"""
+    if value is None and allow_none:
+        return None
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid limit: {value!r}")
+    limit = int(value)
+    if isinstance(value, float) and limit != value:
+        raise ValueError(f"Invalid limit: {value!r}")
+    if limit < 0:
+        raise ValueError(f"Invalid limit: {value!r}")
+    return limit
+
+def _save_new_articles(batch, seen):
+    """Add articles from a batch that are not already stored (by title and source)"""
+    titles = {article_data['title'] for article_data in batch}
+    existing = {
+        (title, source)
+        for title, source in db.session.query(DraftArticle.title, DraftArticle.source)
+        .filter(DraftArticle.title.in_(titles))
+    }
+    
+    saved_count = 0
+    for article_data in batch:
+        key = (article_data['title'], article_data['source'])
+        if key in existing or key in seen:
+            continue
+        seen.add(key)
+        
+        draft = DraftArticle(
+            title=article_data['title'],
+            original_text=article_data['original_text'],
+            source=article_data['source'],
+            category=article_data.get('category'),
+            url=article_data.get('url'),
+            status='pending'
+        )
+        db.session.add(draft)
+        saved_count += 1
+    
+    return saved_count
+
 @dashboard_bp.route('/rewrite/<int:article_id>', methods=['POST'])
 def rewrite_article(article_id):
     """Generate AI rewrite for article"""
@@ -85,7 +129,7 @@ def rewrite_article(article_id):
         if not Config.GEMINI_API_KEY:
             return jsonify({'error': 'Gemini API key not configured'}), 500
         
-        ai_service = AIService(Config.GEMINI_API_KEY)
+        ai_service = get_ai_service(Config.GEMINI_API_KEY)
         
         # Generate rewrite
         ai_text = ai_service.rewrite_article(
@@ -111,6 +155,54 @@ def rewrite_article(article_id):
         db.session.rollback()
         return jsonify({'error': 'Failed to rewrite article'}), 500
 
+@dashboard_bp.route('/generate/<int:article_id>', methods=['POST'])
+def generate_draft(article_id):
+    """Generate AI rewrite, summary and key points for article in one request"""
+    try:
+        article = DraftArticle.query.get_or_404(article_id)
+        
+        # Get rewrite options from request
+        data = request.get_json(silent=True) or {}
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Request body must be a JSON object'}), 400
+        
+        tone = data.get('tone', 'professional')
+        length = data.get('length', 'medium')
+        language = data.get('language', 'en')
+        
+        # Initialize AI service
+        if not Config.GEMINI_API_KEY:
+            return jsonify({'error': 'Gemini API key not configured'}), 500
+        
+        ai_service = get_ai_service(Config.GEMINI_API_KEY)
+        
+        # Generate all outputs together
+        draft = ai_service.generate_draft(
+            article.original_text,
+            tone=tone,
+            length=length,
+            language=language
+        )
+        
+        if not any(draft.values()):
+            return jsonify({'error': 'Failed to generate AI draft'}), 500
+        
+        for field, value in draft.items():
+            if value:
+                setattr(article, field, value)
+        db.session.commit()
+        
+        return jsonify({
+            'message': 'Draft generated successfully',
+            'article': article.to_dict(),
+            'missing': [field for field, value in draft.items() if not value]
+        })
+            
+    except Exception as e:
+        logger.error(f"Error generating draft for article {article_id}: {str(e)}")
+        db.session.rollback()
+        return jsonify({'error': 'Failed to generate draft'}), 500
+
 @dashboard_bp.route('/delete/<int:article_id>', methods=['DELETE'])
 def delete_draft(article_id):
     """Delete a draft article"""
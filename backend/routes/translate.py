@@ -0,0 +1,139 @@
+from flask import Blueprint, jsonify, request
+from sqlalchemy.exc import IntegrityError
+from ..models import db, DraftArticle, ArticleTranslation
+from ..services.ai_service import get_ai_service, TRANSLATION_MODES
+from ..config import Config
+import logging
+
+logger = logging.getLogger(__name__)
+
+translate_bp = Blueprint('translate', __name__)
+
+@translate_bp.route('/translate/<int:article_id>', methods=['POST'])
+def translate_article(article_id):
+    """Translate article into several languages, reusing stored translations"""
+    try:
+        article = DraftArticle.query.get_or_404(article_id)
+        
+        # Get translation options from request
+        settings = Config.TRANSLATION_SETTINGS
+        data = request.get_json(silent=True) or {}
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Request body must be a JSON object'}), 400
+        
+        languages = data.get('languages', settings['languages'])
+        mode = data.get('mode', settings['default_mode'])
+        force = data.get('force', False)
+        
+        if not isinstance(force, bool):
+            return jsonify({'error': 'force must be a boolean'}), 400
+        
+        if isinstance(languages, str):
+            languages = [languages]
+        if not isinstance(languages, list) or not all(isinstance(lang, str) for lang in languages):
+            return jsonify({'error': 'languages must be a string or a list of strings'}), 400
+        languages = list(dict.fromkeys(lang.strip() for lang in languages if lang.strip()))
+        if not languages:
+            return jsonify({'error': 'No target languages given'}), 400
+        
+        if mode not in TRANSLATION_MODES:
+            return jsonify({'error': f"mode must be one of: {', '.join(TRANSLATION_MODES)}"}), 400
+        
+        source_text = article.translation_source
+        source_hash = ArticleTranslation.hash_source(source_text)
+        
+        # Translations of an earlier version of the text are redone
+        stored = {t.language: t for t in article.translations}
+        pending = [
+            lang for lang in languages
+            if force or lang not in stored or stored[lang].source_hash != source_hash
+        ]
+        
+        translated = {}
+        if pending:
+            # Initialize AI service
+            if not Config.GEMINI_API_KEY:
+                return jsonify({'error': 'Gemini API key not configured'}), 500
+            
+            ai_service = get_ai_service(Config.GEMINI_API_KEY)
+            
+            translated = ai_service.translate_article_multi(
+                source_text,
+                pending,
+                mode=mode,
+                max_workers=settings['max_workers']
+            )
+            
+            try:
+                stored = _store_translations(article, translated, source_hash)
+            except IntegrityError:
+                # A concurrent request stored some of these languages first
+                db.session.rollback()
+                stored = _store_translations(article, translated, source_hash)
+        
+        failed = [lang for lang in pending if lang not in translated]
+        
+        return jsonify({
+            'message': f'Translated article into {len(translated)} new languages',
+            'translations': {
+                lang: stored[lang].to_dict()
+                for lang in languages
+                if lang in stored and stored[lang].source_hash == source_hash
+            },
+            'translated': list(translated),
+            'failed': failed
+        })
+        
+    except Exception as e:
+        logger.error(f"Error translating article {article_id}: {str(e)}")
+        db.session.rollback()
+        return jsonify({'error': 'Failed to translate article'}), 500
+
+def _store_translations(article, translated, source_hash):
+    """Insert or update translation rows and return all rows by language"""
+    stored = {t.language: t for t in article.translations}
+    
+    for language, text in translated.items():
+        if language in stored:
+            stored[language].text = text
+            stored[language].source_hash = source_hash
+        else:
+            stored[language] = ArticleTranslation(
+                article=article,
+                language=language,
+                text=text,
+                source_hash=source_hash
+            )
+            db.session.add(stored[language])
+    
+    db.session.commit()
+    return stored
+
+@translate_bp.route('/translations/<int:article_id>', methods=['GET'])
+def get_translations(article_id):
+    """Get stored translations of an article's current text"""
+    try:
+        article = DraftArticle.query.get_or_404(article_id)
+        return jsonify([translation.to_dict() for translation in article.current_translations()])
+    except Exception as e:
+        logger.error(f"Error fetching translations for article {article_id}: {str(e)}")
+        return jsonify({'error': 'Article not found'}), 404
+
+@translate_bp.route('/translations/<int:article_id>/<language>', methods=['GET'])
+def get_translation(article_id, language):
+    """Get stored translation of an article's current text in one language"""
+    try:
+        article = db.session.get(DraftArticle, article_id)
+        translation = next(
+            (t for t in article.current_translations() if t.language == language),
+            None
+        ) if article else None
+        
+        if translation:
+            return jsonify(translation.to_dict())
+        else:
+            return jsonify({'error': 'Translation not found'}), 404
+            
+    except Exception as e:
+        logger.error(f"Error fetching {language} translation for article {article_id}: {str(e)}")
+        return jsonify({'error': 'Failed to fetch translation'}), 500
@@ -1,14 +1,52 @@
-import google.generativeai as genai
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
+import json
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+TRANSLATION_MODES = ('concurrent', 'combined')
+
+BULLET_PREFIX_RE = re.compile(r'^\s*(?:[-*\u2022]|\d+[.)])\s+')
+
+# JSON schema for the combined rewrite + summary + key points response
+DRAFT_SCHEMA = {
+    'type': 'object',
+    'properties': {
+        'ai_text': {'type': 'string'},
+        'summary': {'type': 'string'},
+        'key_points': {'type': 'array', 'items': {'type': 'string'}}
+    },
+    'required': ['ai_text', 'summary', 'key_points']
+}
+
+@lru_cache(maxsize=None)
+def get_ai_service(api_key: str) -> 'AIService':
+    """Return a shared AIService for this process, created on first use"""
+    return AIService(api_key)
+
 class AIService:
+    LENGTH_INSTRUCTIONS = {
+        'short': 'Keep it concise, around 100-150 words',
+        'medium': 'Write a medium-length article, around 200-300 words',
+        'long': 'Write a comprehensive article, around 400-500 words'
+    }
+    
+    TONE_INSTRUCTIONS = {
+        'professional': 'Use a professional, journalistic tone',
+        'casual': 'Use a casual, conversational tone',
+        'formal': 'Use a formal, academic tone'
+    }
+    
     def __init__(self, api_key: str):
         if not api_key:
             raise ValueError("Gemini API key is required")
         
+        # Imported here so that loading the app does not pull in the SDK
+        import google.generativeai as genai
+        
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel('gemini-pro')
     
@@ -35,23 +73,11 @@ class AIService:
     
     def _build_rewrite_prompt(self, text: str, tone: str, length: str, language: str) -> str:
         """Build prompt for article rewriting"""
-        length_instructions = {
-            'short': 'Keep it concise, around 100-150 words',
-            'medium': 'Write a medium-length article, around 200-300 words',
-            'long': 'Write a comprehensive article, around 400-500 words'
-        }
-        
-        tone_instructions = {
-            'professional': 'Use a professional, journalistic tone',
-            'casual': 'Use a casual, conversational tone',
-            'formal': 'Use a formal, academic tone'
-        }
-        
         prompt = f"""
 Please rewrite the following news article with these specifications:
 
-TONE: {tone_instructions.get(tone, 'professional')}
-LENGTH: {length_instructions.get(length, 'medium-length')}
+TONE: {self.TONE_INSTRUCTIONS.get(tone, 'professional')}
+LENGTH: {self.LENGTH_INSTRUCTIONS.get(length, 'medium-length')}
 LANGUAGE: {language}
 
 Requirements:
@@ -105,8 +131,7 @@ Key Points:
             response = self.model.generate_content(prompt)
             
             if response.text:
-                points = response.text.strip().split('\n')
-                return [point.strip() for point in points if point.strip()]
+                return self._parse_bullets(response.text) or None
             
             return None
             
@@ -114,6 +139,99 @@ Key Points:
             logger.error(f"Error extracting key points: {str(e)}")
             return None
     
+    def _parse_bullets(self, text: str) -> List[str]:
+        """Split a bulleted or numbered list into its items"""
+        points = []
+        for line in text.strip().splitlines():
+            point = BULLET_PREFIX_RE.sub('', line).strip()
+            if point:
+                points.append(point)
+        return points
+    
+    def generate_draft(self,
+                       original_text: str,
+                       tone: str = 'professional',
+                       length: str = 'medium',
+                       language: str = 'en',
+                       summary_length: int = 150) -> Dict[str, Any]:
+        """Generate rewrite, summary and key points in a single request.
+
+        The model is asked for one JSON object holding all three outputs.
+        Any field that is missing or malformed in that response is filled
+        in with the matching single-task call; fields that still fail are
+        returned as ``None``.
+        """
+        draft = {'ai_text': None, 'summary': None, 'key_points': None}
+        
+        try:
+            prompt = self._build_draft_prompt(original_text, tone, length, language, summary_length)
+            
+            response = self.model.generate_content(prompt)
+            
+            data = self._parse_json_response(response.text) if response.text else None
+            if isinstance(data, dict):
+                draft.update(self._validate_draft(data, summary_length))
+            else:
+                logger.error("No valid JSON draft in Gemini response")
+                
+        except Exception as e:
+            logger.error(f"Error generating draft: {str(e)}")
+        
+        if draft['ai_text'] is None:
+            draft['ai_text'] = self.rewrite_article(original_text, tone=tone, length=length, language=language)
+        if draft['summary'] is None:
+            draft['summary'] = self.generate_summary(original_text, max_length=summary_length)
+        if draft['key_points'] is None:
+            draft['key_points'] = self.extract_key_points(original_text)
+        
+        return draft
+    
+    def _build_draft_prompt(self, text: str, tone: str, length: str, language: str, summary_length: int) -> str:
+        """Build prompt for combined rewrite, summary and key point generation"""
+        prompt = f"""
+Please produce the following from the news article below:
+
+1. "ai_text": a rewrite of the article
+   TONE: {self.TONE_INSTRUCTIONS.get(tone, 'professional')}
+   LENGTH: {self.LENGTH_INSTRUCTIONS.get(length, 'medium-length')}
+   LANGUAGE: {language}
+   Maintain all factual information, make it engaging and well-structured,
+   and ensure proper grammar and spelling.
+2. "summary": a concise summary in {summary_length} characters or less
+3. "key_points": 3-5 key points, each a short sentence
+
+Respond with only a JSON object matching this schema:
+{json.dumps(DRAFT_SCHEMA)}
+
+Original Article:
+{text}
+
+JSON:
+"""
+        return prompt
+    
+    def _validate_draft(self, data: Dict[str, Any], summary_length: int) -> Dict[str, Any]:
+        """Keep only the well-formed fields of a combined draft response"""
+        draft = {}
+        
+        ai_text = data.get('ai_text')
+        if isinstance(ai_text, str) and ai_text.strip():
+            draft['ai_text'] = ai_text.strip()
+        
+        summary = data.get('summary')
+        if isinstance(summary, str) and summary.strip():
+            draft['summary'] = summary.strip()[:summary_length]
+        
+        key_points = data.get('key_points')
+        if isinstance(key_points, str):
+            key_points = self._parse_bullets(key_points)
+        if isinstance(key_points, list):
+            key_points = [point.strip() for point in key_points if isinstance(point, str) and point.strip()]
+            if key_points:
+                draft['key_points'] = key_points
+        
+        return draft
+    
     def translate_article(self, text: str, target_language: str) -> Optional[str]:
         """Translate article to target language"""
         try:
@@ -134,4 +252,75 @@ Translation:
             
         except Exception as e:
             logger.error(f"Error translating article: {str(e)}")
-            return None
\ No newline at end of file
+            return None
+    
+    def translate_article_multi(self,
+                                text: str,
+                                target_languages: List[str],
+                                mode: str = 'concurrent',
+                                max_workers: int = 6) -> Dict[str, str]:
+        """Translate article to several languages at once.
+
+        ``concurrent`` issues one request per language in parallel;
+        ``combined`` asks for every language in a single JSON response and
+        falls back to per-language calls for any language it is missing.
+        Languages that fail are left out of the returned mapping.
+        """
+        if not target_languages:
+            return {}
+        
+        translations = {}
+        if mode == 'combined' and len(target_languages) > 1:
+            translations = self._translate_combined(text, target_languages)
+        
+        missing = [lang for lang in target_languages if lang not in translations]
+        if missing:
+            workers = max(1, min(max_workers, len(missing)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(lambda lang: self.translate_article(text, lang), missing)
+                for lang, translation in zip(missing, results):
+                    if translation:
+                        translations[lang] = translation
+        
+        return translations
+    
+    def _translate_combined(self, text: str, target_languages: List[str]) -> Dict[str, str]:
+        """Translate article to several languages in one request"""
+        try:
+            prompt = f"""
+Translate the following article into each of these languages: {', '.join(target_languages)}.
+Maintain the journalistic style and all factual information.
+
+Respond with only a JSON object whose keys are exactly these language codes
+and whose values are the full translated article text.
+
+Article:
+{text}
+
+JSON:
+"""
+            
+            response = self.model.generate_content(prompt)
+            
+            data = self._parse_json_response(response.text) if response.text else None
+            if not isinstance(data, dict):
+                return {}
+            
+            return {
+                lang: data[lang].strip()
+                for lang in target_languages
+                if isinstance(data.get(lang), str) and data[lang].strip()
+            }
+            
+        except Exception as e:
+            logger.error(f"Error translating article to {target_languages}: {str(e)}")
+            return {}
+    
+    def _parse_json_response(self, text: str) -> Optional[Any]:
+        """Parse JSON from a model response, tolerating markdown code fences"""
+        cleaned = re.sub(r'^```(?:json)?\s*|\s*```$', '', text.strip())
+        try:
+            return json.loads(cleaned)
+        except ValueError:
+            logger.error("Could not parse JSON from Gemini response")
+            return None
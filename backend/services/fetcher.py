@@ -1,50 +1,72 @@
-import feedparser
-import requests
+import re
 from datetime import datetime
-from typing import List, Dict, Optional
+from itertools import islice
+from typing import List, Dict, Optional, Iterable, Iterator
 import logging
 
 logger = logging.getLogger(__name__)
 
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 class FetcherService:
     def __init__(self, rss_feeds: List[str]):
         self.rss_feeds = rss_feeds
         
-    def fetch_articles(self, limit: int = 10) -> List[Dict]:
+    def fetch_articles(self, limit: int = 10, per_feed_limit: Optional[int] = None) -> List[Dict]:
         """Fetch articles from RSS feeds"""
-        articles = []
-        
-        for feed_url in self.rss_feeds:
-            try:
-                articles.extend(self._fetch_from_feed(feed_url, limit // len(self.rss_feeds)))
-            except Exception as e:
-                logger.error(f"Error fetching from {feed_url}: {str(e)}")
-                continue
-                
-        return articles[:limit]
+        return list(self.iter_articles(limit=limit, per_feed_limit=per_feed_limit))
     
-    def _fetch_from_feed(self, feed_url: str, limit: int) -> List[Dict]:
-        """Fetch articles from a single RSS feed"""
+    def iter_articles(self,
+                      limit: Optional[int] = None,
+                      per_feed_limit: Optional[int] = None) -> Iterator[Dict]:
+        """Lazily yield articles from all RSS feeds.
+
+        Entries are parsed one at a time as the consumer pulls them, so
+        nothing beyond the current feed is held in memory. ``limit`` caps
+        the total number of articles across feeds and ``per_feed_limit``
+        caps each individual feed; ``None`` means no cap.
+        """
+        articles = (
+            article
+            for feed_url in self.rss_feeds
+            for article in self._iter_feed(feed_url, per_feed_limit)
+        )
+        return islice(articles, limit)
+    
+    def _iter_feed(self, feed_url: str, limit: Optional[int]) -> Iterator[Dict]:
+        """Yield articles from a single RSS feed"""
         try:
+            import feedparser
             feed = feedparser.parse(feed_url)
-            articles = []
-            
-            for entry in feed.entries[:limit]:
-                article = {
+        except Exception as e:
+            logger.error(f"Error parsing feed {feed_url}: {str(e)}")
+            return
+        
+        source = feed.feed.get('title', 'Unknown Source')
+        
+        for entry in islice(feed.entries, limit):
+            try:
+                yield {
                     'title': entry.get('title', 'No Title'),
                     'original_text': self._extract_content(entry),
-                    'source': feed.feed.get('title', 'Unknown Source'),
+                    'source': source,
                     'url': entry.get('link', ''),
                     'category': self._extract_category(entry),
                     'published': entry.get('published', '')
                 }
-                articles.append(article)
-                
-            return articles
-            
-        except Exception as e:
-            logger.error(f"Error parsing feed {feed_url}: {str(e)}")
-            return []
+            except Exception as e:
+                logger.error(f"Error extracting entry from {feed_url}: {str(e)}")
+                continue
+    
+    @staticmethod
+    def batched(articles: Iterable[Dict], batch_size: int) -> Iterator[List[Dict]]:
+        """Group a stream of articles into lists of at most ``batch_size``"""
+        iterator = iter(articles)
+        while True:
+            batch = list(islice(iterator, batch_size))
+            if not batch:
+                return
+            yield batch
     
     def _extract_content(self, entry) -> str:
         """Extract content from RSS entry"""
@@ -59,8 +81,7 @@ class FetcherService:
             content = entry.description
         
         # Clean HTML tags (basic cleaning)
-        import re
-        content = re.sub(r'<[^>]+>', '', content)
+        content = HTML_TAG_RE.sub('', content)
         content = content.strip()
         
         return content[:1000] if content else 'No content available'
@@ -73,6 +94,9 @@ class FetcherService:
     
     def validate_feed_url(self, url: str) -> bool:
         """Validate if URL is a valid RSS feed"""
+        import feedparser
+        import requests
+        
         try:
             response = requests.get(url, timeout=10)
             if response.status_code == 200:
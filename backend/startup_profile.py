@@ -0,0 +1,84 @@
+"""Report import and initialization cost of the backend at startup.
+
+Run from the repository root with ``python -m backend.startup_profile``.
+Pass ``--full`` to also load the lazily imported feed and AI stacks.
+"""
+import importlib
+import sys
+import time
+from typing import Callable, List, Tuple
+
+# Imported in dependency order so each timing only covers what is new
+APP_MODULES = [
+    'flask',
+    'flask_sqlalchemy',
+    'flask_cors',
+    'dotenv',
+    'backend.config',
+    'backend.models',
+    'backend.services.fetcher',
+    'backend.services.ai_service',
+    'backend.services.storage',
+    'backend.routes.dashboard',
+    'backend.routes.approve',
+    'backend.routes.translate',
+    'backend.app',
+]
+
+LAZY_MODULES = [
+    'feedparser',
+    'requests',
+    'google.generativeai',
+]
+
+def _timed(func: Callable) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+def _import_timings(modules: List[str]) -> List[Tuple[str, float]]:
+    timings = []
+    for name in modules:
+        if name in sys.modules:
+            timings.append((name, 0.0))
+            continue
+        timings.append((name, _timed(lambda: importlib.import_module(name))))
+    return timings
+
+def _init_timings(full: bool) -> List[Tuple[str, float]]:
+    from backend.app import create_app, _create_tables
+    from backend.config import Config
+    
+    # Schema setup is timed on its own so that lazy mode cannot hide it
+    start = time.perf_counter()
+    app = create_app(create_tables=False)
+    timings = [('create_app(create_tables=False)', (time.perf_counter() - start) * 1000)]
+    
+    with app.app_context():
+        timings.append(('_create_tables()', _timed(_create_tables)))
+    
+    if full and Config.GEMINI_API_KEY:
+        from backend.services.ai_service import get_ai_service
+        timings.append(('get_ai_service()', _timed(lambda: get_ai_service(Config.GEMINI_API_KEY))))
+    
+    return timings
+
+def _print_section(title: str, timings: List[Tuple[str, float]]):
+    print(title)
+    for name, ms in timings:
+        print(f'  {name:<32} {ms:9.1f} ms')
+    print(f'  {"total":<32} {sum(ms for _, ms in timings):9.1f} ms')
+
+def main(argv: List[str] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    full = '--full' in argv
+    
+    _print_section('Imports', _import_timings(APP_MODULES))
+    if full:
+        _print_section('Lazy imports', _import_timings(LAZY_MODULES))
+    _print_section('Initialization', _init_timings(full))
+    
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())